@@ -4,21 +4,166 @@ Analyzes speech features and provides actionable feedback for interview performa
 """
 
 import json
+import operator
 import numpy as np
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
 
+from jit_support import NUMBA_AVAILABLE, jit as _jit
 
+
+@lru_cache(maxsize=1)
 def load_config():
-    """Load configuration file with baseline ranges and weights."""
+    """
+    Load configuration file with baseline ranges and weights.
+    
+    The file is parsed once per process and the same dict is returned on
+    every call, so callers must treat it as read-only.
+    """
     config_path = Path(__file__).parent / "config.json"
     with open(config_path, 'r') as f:
         return json.load(f)
 
 
+# Scoring dimensions, in the order used by the packed score/weight vectors
+_DIMENSIONS = ('vocal', 'articulatory', 'prosodic', 'timing')
+
+# Quality levels from lowest to highest, separated by the severity thresholds
+_SEVERITY_LABELS = ("Needs Improvement", "Fair", "Good", "Excellent")
+
+
+@lru_cache(maxsize=1)
+def _weight_vector():
+    """Confidence weights from the config as a read-only array ordered like _DIMENSIONS."""
+    weights = load_config()['confidence_weights']
+    vector = np.array([weights[dim] for dim in _DIMENSIONS], dtype=np.float64)
+    vector.flags.writeable = False
+    return vector
+
+
+@lru_cache(maxsize=1)
+def _severity_bounds():
+    """Severity thresholds from the config, pre-scaled to 0-100 and sorted for searchsorted."""
+    thresholds = load_config()['severity_thresholds']
+    bounds = np.array([
+        thresholds['severe'],
+        thresholds['moderate'],
+        thresholds['mild']
+    ]) * 100
+    bounds.flags.writeable = False
+    return bounds
+
+
+# Features scored against a baseline range: (feature key, baseline key, lower is better)
+_VOCAL_RANGE_FEATURES = (
+    ('f0_std', 'f0_std', False),
+    ('jitter', 'jitter', True),
+    ('shimmer', 'shimmer', True),
+    ('hnr', 'hnr', False),
+    ('f0_range', 'pitch_range', False),
+)
+_TIMING_RANGE_FEATURES = (
+    ('speech_rate', 'speech_rate', False),
+    ('pause_frequency', 'pause_frequency', False),
+)
+
+class SpeechFeatures(NamedTuple):
+    """
+    Scored speech features flattened into fixed fields, grouped by dimension.
+    
+    Field order is the packed layout used by the scoring kernels, so
+    ``np.array(features)`` yields the score buffer directly.
+    """
+    # Vocal
+    f0_std: float
+    jitter: float
+    shimmer: float
+    hnr: float
+    f0_range: float
+    # Articulatory
+    spectral_contrast_mean: float
+    zcr_mean: float
+    # Prosodic
+    pitch_variation: float
+    energy_variation: float
+    # Timing
+    speech_rate: float
+    pause_frequency: float
+    pause_to_speech_ratio: float
+    
+    @classmethod
+    def from_dict(cls, features_dict):
+        """Flatten the nested dict returned by analyze_speech()."""
+        vocal = features_dict['vocal']
+        articulatory = features_dict['articulatory']
+        prosodic = features_dict['prosodic']
+        timing = features_dict['timing']
+        return cls(
+            vocal['f0_std'],
+            vocal['jitter'],
+            vocal['shimmer'],
+            vocal['hnr'],
+            vocal['f0_range'],
+            articulatory['spectral_contrast_mean'],
+            articulatory['zcr_mean'],
+            prosodic['pitch_variation'],
+            prosodic['energy_variation'],
+            timing['speech_rate'],
+            timing['pause_frequency'],
+            timing['pause_to_speech_ratio']
+        )
+
+
+# SpeechFeatures slots belonging to each dimension
+_VOCAL_SLOTS = slice(0, 5)
+_ARTICULATORY_SLOTS = slice(5, 7)
+_PROSODIC_SLOTS = slice(7, 9)
+_TIMING_SLOTS = slice(9, 12)
+
+
+def _baseline_arrays(baseline, specs):
+    """Pack the baseline ranges for ``specs`` into (mins, maxs, inverse) arrays."""
+    ranges = np.array([baseline[key] for _, key, _ in specs], dtype=np.float64)
+    inverse = np.array([inv for _, _, inv in specs], dtype=bool)
+    mins, maxs = np.ascontiguousarray(ranges.T)
+    return mins, maxs, inverse
+
+
+@lru_cache(maxsize=1)
+def _range_bounds():
+    """Read-only vocal + timing range bounds from the config, in _score_all order."""
+    bounds = _baseline_arrays(
+        load_config()['baseline_ranges'], _VOCAL_RANGE_FEATURES + _TIMING_RANGE_FEATURES
+    )
+    for array in bounds:
+        array.flags.writeable = False
+    return bounds
+
+
+@_jit
+def _normalize(values, min_vals, max_vals, inverse):
+    """Element-wise normalization of feature arrays (see normalize_feature)."""
+    # For features where lower is better (e.g., jitter, shimmer)
+    lower_better = np.clip(1.0 - (values - min_vals) / (max_vals - min_vals), 0.0, 1.0)
+    
+    # For features where being in range is better
+    in_range = (values >= min_vals) & (values <= max_vals)
+    below = np.maximum(0.0, values / min_vals)
+    above = np.maximum(0.0, 1.0 - (values - max_vals) / max_vals)
+    range_score = np.where(in_range, 1.0, np.where(values < min_vals, below, above))
+    
+    normalized = np.where(inverse, lower_better, range_score)
+    return np.where(values == 0, 0.5, normalized)  # Neutral score for missing values
+
+
 def normalize_feature(value, baseline_range, inverse=False):
     """
     Normalize a feature value to 0-1 scale based on baseline range.
     
+    Also accepts arrays: ``value`` of shape (N,), ``baseline_range`` of
+    shape (N, 2) and ``inverse`` as a scalar or (N,) boolean array.
+    
     Args:
         value: Feature value
         baseline_range: [min, max] healthy range
@@ -27,133 +172,146 @@ def normalize_feature(value, baseline_range, inverse=False):
     Returns:
         float: Normalized score (0-1, where 1 is healthy)
     """
-    if value == 0:
-        return 0.5  # Neutral score for missing values
-    
-    min_val, max_val = baseline_range
-    
-    if inverse:
-        # For features where lower is better (e.g., jitter, shimmer)
-        if value <= min_val:
-            return 1.0
-        elif value >= max_val:
-            return 0.0
-        else:
-            return 1.0 - (value - min_val) / (max_val - min_val)
-    else:
-        # For features where being in range is better
-        if min_val <= value <= max_val:
-            return 1.0
-        elif value < min_val:
-            return max(0.0, value / min_val)
-        else:
-            return max(0.0, 1.0 - (value - max_val) / max_val)
+    values = np.atleast_1d(np.asarray(value, dtype=np.float64))
+    ranges = np.asarray(baseline_range, dtype=np.float64).reshape(-1, 2)
+    inverse = np.broadcast_to(np.asarray(inverse, dtype=bool), values.shape).copy()
+    mins, maxs = np.ascontiguousarray(np.broadcast_to(ranges, (values.size, 2)).T)
+    normalized = _normalize(values, mins, maxs, inverse)
+    return float(normalized[0]) if np.ndim(value) == 0 else normalized
 
 
-def calculate_vocal_score(vocal_features, config):
-    """Calculate vocal quality score (0-100)."""
-    baseline = config['baseline_ranges']
-    
-    scores = []
-    
-    # F0 variability (std) - healthy range
-    if vocal_features['f0_std'] > 0:
-        f0_std_score = normalize_feature(vocal_features['f0_std'], baseline['f0_std'])
-        scores.append(f0_std_score)
-    
-    # Jitter - lower is better
-    if vocal_features['jitter'] > 0:
-        jitter_score = normalize_feature(vocal_features['jitter'], baseline['jitter'], inverse=True)
-        scores.append(jitter_score)
-    
-    # Shimmer - lower is better
-    if vocal_features['shimmer'] > 0:
-        shimmer_score = normalize_feature(vocal_features['shimmer'], baseline['shimmer'], inverse=True)
-        scores.append(shimmer_score)
-    
-    # HNR - higher is better
-    if vocal_features['hnr'] > 0:
-        hnr_score = normalize_feature(vocal_features['hnr'], baseline['hnr'])
-        scores.append(hnr_score)
-    
-    # Pitch range
-    if vocal_features['f0_range'] > 0:
-        pitch_range_score = normalize_feature(vocal_features['f0_range'], baseline['pitch_range'])
-        scores.append(pitch_range_score)
-    
-    return np.mean(scores) * 100 if scores else 50.0
+def _dimension_values(features, slots):
+    """Pack a single dimension's feature dict into its SpeechFeatures slot order."""
+    return np.array([features[key] for key in SpeechFeatures._fields[slots]], dtype=np.float64)
 
 
-def calculate_articulatory_score(articulatory_features, config):
-    """Calculate articulation clarity score (0-100)."""
+@_jit
+def _vocal_score(values, mins, maxs, inverse):
+    """Vocal quality score (0-100) from the packed vocal slots."""
+    # Only score features that were actually measured
+    measured = values > 0
+    count = measured.sum()
+    if count == 0:
+        return 50.0
+    
+    scores = _normalize(values, mins, maxs, inverse)
+    return np.where(measured, scores, 0.0).sum() / count * 100  # NaN (undefined in Praat) is unmeasured
+
+
+@_jit
+def _articulatory_score(values):
+    """Articulation clarity score (0-100) from the packed articulatory slots."""
     # Use spectral features as proxies for articulation quality
     # Higher spectral contrast and centroid variation indicate clearer articulation
-    
-    scores = []
+    contrast = values[0]
+    zcr = values[1]
     
     # Spectral contrast (higher is better for clarity)
-    if articulatory_features['spectral_contrast_mean'] > 15:
-        scores.append(1.0)
-    elif articulatory_features['spectral_contrast_mean'] > 10:
-        scores.append(0.7)
+    if contrast > 15:
+        contrast_score = 1.0
+    elif contrast > 10:
+        contrast_score = 0.7
     else:
-        scores.append(0.4)
+        contrast_score = 0.4
     
     # ZCR variation (moderate variation is good)
-    if 0.05 < articulatory_features['zcr_mean'] < 0.15:
-        scores.append(1.0)
-    else:
-        scores.append(0.6)
+    zcr_score = 1.0 if 0.05 < zcr < 0.15 else 0.6
     
-    return np.mean(scores) * 100 if scores else 50.0
+    return (contrast_score + zcr_score) / 2 * 100
 
 
-def calculate_prosodic_score(prosodic_features, config):
-    """Calculate prosodic variation score (0-100)."""
-    scores = []
-    
+@_jit
+def _prosodic_score(values):
+    """Prosodic variation score (0-100) from the packed prosodic slots."""
     # Pitch variation (coefficient of variation)
-    if prosodic_features['pitch_variation'] > 0.15:
-        scores.append(1.0)
-    elif prosodic_features['pitch_variation'] > 0.08:
-        scores.append(0.7)
+    pitch_variation = values[0]
+    if pitch_variation > 0.15:
+        pitch_score = 1.0
+    elif pitch_variation > 0.08:
+        pitch_score = 0.7
     else:
-        scores.append(0.3)
+        pitch_score = 0.3
     
     # Energy variation
-    if prosodic_features['energy_variation'] > 0.3:
-        scores.append(1.0)
-    elif prosodic_features['energy_variation'] > 0.15:
-        scores.append(0.7)
+    energy_variation = values[1]
+    if energy_variation > 0.3:
+        energy_score = 1.0
+    elif energy_variation > 0.15:
+        energy_score = 0.7
     else:
-        scores.append(0.4)
+        energy_score = 0.4
     
-    return np.mean(scores) * 100 if scores else 50.0
+    return (pitch_score + energy_score) / 2 * 100
 
 
-def calculate_timing_score(timing_features, config):
-    """Calculate speech timing score (0-100)."""
-    baseline = config['baseline_ranges']
-    
-    scores = []
-    
-    # Speech rate
-    speech_rate_score = normalize_feature(timing_features['speech_rate'], baseline['speech_rate'])
-    scores.append(speech_rate_score)
-    
-    # Pause frequency
-    pause_freq_score = normalize_feature(timing_features['pause_frequency'], baseline['pause_frequency'])
-    scores.append(pause_freq_score)
+@_jit
+def _timing_score(values, mins, maxs, inverse):
+    """Speech timing score (0-100) from the packed timing slots."""
+    # Speech rate and pause frequency
+    total = _normalize(values[:2], mins, maxs, inverse).sum()
     
     # Pause-to-speech ratio (lower is generally better)
-    if timing_features['pause_to_speech_ratio'] < 0.3:
-        scores.append(1.0)
-    elif timing_features['pause_to_speech_ratio'] < 0.5:
-        scores.append(0.7)
+    ratio = values[2]
+    if ratio < 0.3:
+        total += 1.0
+    elif ratio < 0.5:
+        total += 0.7
     else:
-        scores.append(0.4)
+        total += 0.4
+    
+    return total / 3 * 100
+
+
+@_jit
+def _score_all(values, mins, maxs, inverse, weights):
+    """
+    Score a packed SpeechFeatures buffer in one compiled call.
     
-    return np.mean(scores) * 100 if scores else 50.0
+    ``mins``/``maxs``/``inverse`` hold the vocal range bounds followed by
+    the timing ones. Returns (overall score, dimension scores).
+    """
+    dim_scores = np.empty(4)
+    dim_scores[0] = _vocal_score(values[0:5], mins[0:5], maxs[0:5], inverse[0:5])
+    dim_scores[1] = _articulatory_score(values[5:7])
+    dim_scores[2] = _prosodic_score(values[7:9])
+    dim_scores[3] = _timing_score(values[9:12], mins[5:7], maxs[5:7], inverse[5:7])
+    return np.dot(dim_scores, weights), dim_scores
+
+
+def _warm_up_kernels():
+    """Compile (or load from cache) the scoring kernels for the dtypes used at runtime."""
+    weights = np.zeros(len(_DIMENSIONS))
+    bounds = np.ones(7), np.ones(7), np.zeros(7, dtype=bool)
+    # Match the read-only arrays handed out by _range_bounds() and _weight_vector()
+    for array in (weights,) + bounds:
+        array.flags.writeable = False
+    _score_all(np.zeros(len(SpeechFeatures._fields)), *bounds, weights)
+
+
+if NUMBA_AVAILABLE:
+    _warm_up_kernels()
+
+
+def calculate_vocal_score(vocal_features, config):
+    """Calculate vocal quality score (0-100)."""
+    bounds = _baseline_arrays(config['baseline_ranges'], _VOCAL_RANGE_FEATURES)
+    return _vocal_score(_dimension_values(vocal_features, _VOCAL_SLOTS), *bounds)
+
+
+def calculate_articulatory_score(articulatory_features, config):
+    """Calculate articulation clarity score (0-100)."""
+    return _articulatory_score(_dimension_values(articulatory_features, _ARTICULATORY_SLOTS))
+
+
+def calculate_prosodic_score(prosodic_features, config):
+    """Calculate prosodic variation score (0-100)."""
+    return _prosodic_score(_dimension_values(prosodic_features, _PROSODIC_SLOTS))
+
+
+def calculate_timing_score(timing_features, config):
+    """Calculate speech timing score (0-100)."""
+    bounds = _baseline_arrays(config['baseline_ranges'], _TIMING_RANGE_FEATURES)
+    return _timing_score(_dimension_values(timing_features, _TIMING_SLOTS), *bounds)
 
 
 def calculate_confidence_score(features_dict):
@@ -166,46 +324,71 @@ def calculate_confidence_score(features_dict):
     Returns:
         dict: Confidence scores and dimension breakdown
     """
-    config = load_config()
-    weights = config['confidence_weights']
-    
-    # Calculate dimension scores
-    vocal_score = calculate_vocal_score(features_dict['vocal'], config)
-    articulatory_score = calculate_articulatory_score(features_dict['articulatory'], config)
-    prosodic_score = calculate_prosodic_score(features_dict['prosodic'], config)
-    timing_score = calculate_timing_score(features_dict['timing'], config)
-    
-    # Calculate weighted overall score
-    overall_score = (
-        vocal_score * weights['vocal'] +
-        articulatory_score * weights['articulatory'] +
-        prosodic_score * weights['prosodic'] +
-        timing_score * weights['timing']
-    )
+    # Calculate dimension and weighted overall scores in one compiled kernel
+    values = np.array(SpeechFeatures.from_dict(features_dict), dtype=np.float64)
+    overall_score, dim_scores = _score_all(values, *_range_bounds(), _weight_vector())
+    overall_score = float(overall_score)
     
     # Determine quality level
-    severity_thresholds = config['severity_thresholds']
-    if overall_score >= severity_thresholds['mild'] * 100:
-        severity = "Excellent"
-    elif overall_score >= severity_thresholds['moderate'] * 100:
-        severity = "Good"
-    elif overall_score >= severity_thresholds['severe'] * 100:
-        severity = "Fair"
-    else:
-        severity = "Needs Improvement"
+    severity = _SEVERITY_LABELS[int(np.searchsorted(_severity_bounds(), overall_score, side='right'))]
     
     return {
         'overall_score': overall_score,
         'severity': severity,
         'dimension_scores': {
-            'vocal_quality': vocal_score,
-            'articulation_clarity': articulatory_score,
-            'prosodic_variation': prosodic_score,
-            'speech_timing': timing_score
+            'vocal_quality': dim_scores[0],
+            'articulation_clarity': dim_scores[1],
+            'prosodic_variation': dim_scores[2],
+            'speech_timing': dim_scores[3]
         }
     }
 
 
+# Dimension scores below this get improvement feedback, others get strengths
+_FEEDBACK_SCORE_THRESHOLD = 60
+
+# Feedback rules in report order: (dimension score, rules when weak, rules when strong).
+# Each rule is (feature, op, threshold, finding, recommendations) and fires when
+# op(feature value, threshold) holds; a rule with feature None always fires.
+_FEEDBACK_RULES = (
+    ('vocal_quality', (
+        ('f0_std', operator.lt, 20, "Limited pitch variation detected (monotone speech)",
+         ("Practice varying your pitch - try reading with more expression",)),
+        ('jitter', operator.gt, 0.01, "Voice instability detected",
+         ("Practice vocal exercises to improve voice stability",)),
+        ('hnr', operator.lt, 10, "Voice clarity could be improved",
+         ("Practice breath support and speak with more vocal energy",)),
+    ), (
+        ('f0_std', operator.gt, 30, "Good pitch variation - your speech is expressive", ()),
+    )),
+    ('articulation_clarity', (
+        (None, None, None, "Articulation could be clearer",
+         ("Practice speaking slowly and clearly, emphasizing consonants",
+          "Try tongue twisters and articulation exercises")),
+    ), (
+        (None, None, None, "Clear articulation - words are well-pronounced", ()),
+    )),
+    ('prosodic_variation', (
+        ('pitch_variation', operator.lt, 0.08, "Limited intonation variation",
+         ("Practice speaking with more emotional expression",)),
+        ('energy_variation', operator.lt, 0.15, "Speech energy could be more varied",
+         ("Try emphasizing important words and varying your volume",)),
+    ), (
+        (None, None, None, "Good prosodic variation - natural and engaging speech", ()),
+    )),
+    ('speech_timing', (
+        ('speech_rate', operator.lt, 4.0, "Speech rate is slower than average",
+         ("Practice speaking at a comfortable but steady pace",)),
+        ('speech_rate', operator.gt, 6.5, "Speech rate is faster than average",
+         ("Try slowing down and pausing between thoughts",)),
+        ('pause_frequency', operator.gt, 0.3, "Frequent pauses detected",
+         ("Practice continuous speech with fewer interruptions",)),
+    ), (
+        (None, None, None, "Good speech timing and pacing", ()),
+    )),
+)
+
+
 def generate_feedback(features_dict, confidence_scores):
     """
     Generate personalized feedback based on feature analysis.
@@ -220,58 +403,15 @@ def generate_feedback(features_dict, confidence_scores):
     findings = []
     recommendations = []
     
-    vocal = features_dict['vocal']
-    prosodic = features_dict['prosodic']
-    timing = features_dict['timing']
+    features = SpeechFeatures.from_dict(features_dict)
     scores = confidence_scores['dimension_scores']
     
-    # Vocal quality feedback
-    if scores['vocal_quality'] < 60:
-        if vocal['f0_std'] < 20:
-            findings.append("Limited pitch variation detected (monotone speech)")
-            recommendations.append("Practice varying your pitch - try reading with more expression")
-        if vocal['jitter'] > 0.01:
-            findings.append("Voice instability detected")
-            recommendations.append("Practice vocal exercises to improve voice stability")
-        if vocal['hnr'] < 10:
-            findings.append("Voice clarity could be improved")
-            recommendations.append("Practice breath support and speak with more vocal energy")
-    else:
-        if vocal['f0_std'] > 30:
-            findings.append("Good pitch variation - your speech is expressive")
-    
-    # Articulation feedback
-    if scores['articulation_clarity'] < 60:
-        findings.append("Articulation could be clearer")
-        recommendations.append("Practice speaking slowly and clearly, emphasizing consonants")
-        recommendations.append("Try tongue twisters and articulation exercises")
-    else:
-        findings.append("Clear articulation - words are well-pronounced")
-    
-    # Prosodic feedback
-    if scores['prosodic_variation'] < 60:
-        if prosodic['pitch_variation'] < 0.08:
-            findings.append("Limited intonation variation")
-            recommendations.append("Practice speaking with more emotional expression")
-        if prosodic['energy_variation'] < 0.15:
-            findings.append("Speech energy could be more varied")
-            recommendations.append("Try emphasizing important words and varying your volume")
-    else:
-        findings.append("Good prosodic variation - natural and engaging speech")
-    
-    # Timing feedback
-    if scores['speech_timing'] < 60:
-        if timing['speech_rate'] < 4.0:
-            findings.append("Speech rate is slower than average")
-            recommendations.append("Practice speaking at a comfortable but steady pace")
-        elif timing['speech_rate'] > 6.5:
-            findings.append("Speech rate is faster than average")
-            recommendations.append("Try slowing down and pausing between thoughts")
-        if timing['pause_frequency'] > 0.3:
-            findings.append("Frequent pauses detected")
-            recommendations.append("Practice continuous speech with fewer interruptions")
-    else:
-        findings.append("Good speech timing and pacing")
+    for dimension, weak_rules, strong_rules in _FEEDBACK_RULES:
+        rules = weak_rules if scores[dimension] < _FEEDBACK_SCORE_THRESHOLD else strong_rules
+        for feature, op, threshold, finding, advice in rules:
+            if feature is None or op(getattr(features, feature), threshold):
+                findings.append(finding)
+                recommendations.extend(advice)
     
     # If everything is good
     if not findings:
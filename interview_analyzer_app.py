@@ -6,9 +6,12 @@ Analyzes speech quality from interview responses using multi-dimensional analysi
 import streamlit as st
 import numpy as np
 import os
+import shutil
+import hashlib
 import soundfile as sf
 import tempfile
 import json
+import importlib.util
 from pathlib import Path
 
 # Try to import sounddevice (not available on cloud deployments)
@@ -18,66 +21,65 @@ try:
 except (ImportError, OSError):
     SOUNDDEVICE_AVAILABLE = False
 
-# Import analysis modules
-try:
-    from speech_analyzer import analyze_speech
-    from confidence_scorer import analyze_and_score
-    ANALYSIS_AVAILABLE = True
-except ImportError:
-    ANALYSIS_AVAILABLE = False
+# Check for analysis modules; they pull in librosa/numba, so they are only
+# imported on the first analysis (see load_analyzers)
+ANALYSIS_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("speech_analyzer", "confidence_scorer", "librosa", "parselmouth")
+)
+if not ANALYSIS_AVAILABLE:
     st.error("⚠️ Analysis modules not found. Please check installation.")
 
 st.set_page_config(page_title="Interview Speech Analyzer", layout="wide", page_icon="🎤")
 
 # --------- WELCOME SCREEN ----------
+_WELCOME_HTML = """
+    <style>
+    @import url('https://fonts.googleapis.com/css2?family=Poppins:wght@600&display=swap');
+    
+    .welcome-container {
+        text-align: center;
+        padding: 80px 20px;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        border-radius: 20px;
+        margin: 20px 0;
+    }
+    .welcome-title {
+        font-family: 'Poppins', sans-serif;
+        font-size: 56px;
+        font-weight: 600;
+        color: #ffffff;
+        margin-bottom: 20px;
+        text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
+    }
+    .welcome-subtitle {
+        font-size: 24px;
+        color: #f0f0f0;
+        margin-bottom: 10px;
+    }
+    .welcome-description {
+        font-size: 18px;
+        color: #e0e0e0;
+        max-width: 600px;
+        margin: 0 auto 30px;
+        line-height: 1.6;
+    }
+    </style>
+
+    <div class="welcome-container">
+        <div class="welcome-title">Welcome to 🎤 Interview Speech Analyzer</div>
+        <div class="welcome-description">
+            Get comprehensive feedback on your interview responses with multi-dimensional 
+            speech analysis including vocal quality, articulation, prosody, and timing.
+        </div>
+    </div>
+    """
+
 if "show_welcome" not in st.session_state:
     st.session_state.show_welcome = True
 
 if st.session_state.show_welcome:
-    st.markdown(
-        """
-        <style>
-        @import url('https://fonts.googleapis.com/css2?family=Poppins:wght@600&display=swap');
-        
-        .welcome-container {
-            text-align: center;
-            padding: 80px 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            border-radius: 20px;
-            margin: 20px 0;
-        }
-        .welcome-title {
-            font-family: 'Poppins', sans-serif;
-            font-size: 56px;
-            font-weight: 600;
-            color: #ffffff;
-            margin-bottom: 20px;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
-        }
-        .welcome-subtitle {
-            font-size: 24px;
-            color: #f0f0f0;
-            margin-bottom: 10px;
-        }
-        .welcome-description {
-            font-size: 18px;
-            color: #e0e0e0;
-            max-width: 600px;
-            margin: 0 auto 30px;
-            line-height: 1.6;
-        }
-        </style>
-
-        <div class="welcome-container">
-            <div class="welcome-title">Welcome to 🎤 Interview Speech Analyzer</div>
-            <div class="welcome-description">
-                Get comprehensive feedback on your interview responses with multi-dimensional 
-                speech analysis including vocal quality, articulation, prosody, and timing.
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_WELCOME_HTML, unsafe_allow_html=True)
 
     col1, col2, col3 = st.columns([1, 1, 1])
     with col2:
@@ -89,35 +91,137 @@ if st.session_state.show_welcome:
 
 
 # ---------- LOAD INTERVIEW QUESTIONS ----------
+@st.cache_data(show_spinner=False)
+def _read_interview_questions():
+    """Parse interview_questions.json once and share it across reruns and sessions."""
+    questions_path = Path(__file__).parent / "interview_questions.json"
+    with open(questions_path, 'r') as f:
+        data = json.load(f)
+        return data['questions']
+
+
 def load_interview_questions():
     """Load interview questions from JSON file."""
     try:
-        questions_path = Path(__file__).parent / "interview_questions.json"
-        with open(questions_path, 'r') as f:
-            data = json.load(f)
-            return data['questions']
+        # Errors propagate out of the cached reader, so failures are retried next rerun
+        return _read_interview_questions()
     except Exception as e:
         st.error(f"Could not load interview questions: {e}")
         return []
 
 
 # ---------- SILENCE CHECK ----------
-def is_silent(path, threshold=0.01):
+def _is_silent_streamed(path, threshold, blocksize):
+    """Silence check for formats libsndfile can decode; raises RuntimeError for others."""
+    # Stream fixed-size blocks so memory stays O(blocksize), not O(duration)
+    with sf.SoundFile(path) as f:
+        # Energy the whole clip needs to reach an RMS of `threshold`; once the
+        # running sum passes it, the remaining blocks cannot make the clip silent
+        voiced_energy = threshold ** 2 * f.frames * f.channels
+        total = 0.0
+        n = 0
+        for block in f.blocks(blocksize=blocksize, dtype='float32'):
+            samples = block.ravel()
+            total += float(np.dot(samples, samples))
+            n += samples.size
+            if total >= voiced_energy > 0:
+                return False
+    if n == 0:
+        return True
+    rms = (total / n) ** 0.5
+    return rms < threshold
+
+
+def is_silent(path, threshold=0.01, blocksize=4096):
     """Return True if audio file is effectively silence."""
     try:
-        import librosa
-        y, sr = librosa.load(path, sr=None)
-        if y.size == 0:
-            return True
-        rms = np.sqrt(np.mean(y**2))
-        return rms < threshold
-    except Exception:
+        return _is_silent_streamed(path, threshold, blocksize)
+    except RuntimeError:
+        # libsndfile can't read this format (e.g. m4a): decode it in full instead
+        pass
+    except OSError:
         return False
+    
+    try:
+        from speech_analyzer import load_audio
+        y, _ = load_audio(path, sr=None)
+    except Exception:
+        return False  # Undecodable here; let the analysis report the error
+    if y.size == 0:
+        return True
+    return float(np.sqrt(np.dot(y, y) / y.size)) < threshold
+
+
+# ---------- UPLOAD CACHE ----------
+def upload_digest(audio_file, chunk_size=1 << 16):
+    """Return the SHA-256 hex digest of an uploaded file, read in chunks."""
+    digest = hashlib.sha256()
+    audio_file.seek(0)
+    for chunk in iter(lambda: audio_file.read(chunk_size), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cached_upload_path(audio_file):
+    """Return a temp file with the upload's bytes, reusing it when the same upload is re-analyzed."""
+    cache = st.session_state.upload_cache
+    digest = upload_digest(audio_file)
+    temp_path = cache.get(digest)
+    if temp_path is None or not os.path.exists(temp_path):
+        # A different upload replaces the previously cached file
+        for old_path in cache.values():
+            try:
+                os.unlink(old_path)
+            except FileNotFoundError:
+                pass
+        cache.clear()
+        
+        temp_path = os.path.join(st.session_state.upload_dir.name, f"{digest}.wav")
+        # Copy in 64 KiB chunks rather than materializing the whole upload
+        audio_file.seek(0)
+        with open(temp_path, "wb") as f:
+            shutil.copyfileobj(audio_file, f, length=1 << 16)
+        cache[digest] = temp_path
+    return temp_path
+
+
+# ---------- CACHED ANALYSIS ----------
+@st.cache_resource(show_spinner=False)
+def load_analyzers():
+    """
+    Import the analysis pipeline on first use; returns (analyze_speech, analyze_and_score),
+    or None if an installed dependency fails to import.
+    """
+    try:
+        from speech_analyzer import analyze_speech
+        from confidence_scorer import analyze_and_score
+    except ImportError:
+        return None
+    return analyze_speech, analyze_and_score
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def cached_analyze_speech(path, mtime):
+    """Run analyze_speech once per (path, mtime) so reruns on unchanged audio are instant."""
+    analyze_speech, _ = load_analyzers()
+    return analyze_speech(path)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def cached_analyze_and_score(features):
+    """Run analyze_and_score once per distinct feature set."""
+    _, analyze_and_score = load_analyzers()
+    return analyze_and_score(features)
 
 
 # ---------- SESSION STATE ----------
 if "recorded_audio_path" not in st.session_state:
     st.session_state.recorded_audio_path = None
+if "upload_cache" not in st.session_state:
+    st.session_state.upload_cache = {}  # upload SHA-256 -> temp file path
+if "upload_dir" not in st.session_state:
+    # Per-session directory for cached uploads; removed with the session (or at exit)
+    st.session_state.upload_dir = tempfile.TemporaryDirectory(prefix="interview_uploads_")
 
 # ---------- MAIN UI ----------
 st.title("🎤 Interview Speech Analyzer")
@@ -183,12 +287,13 @@ if questions:
         if st.button(f"🎤 START RECORDING ({duration} seconds)", type="primary", key="record"):
             with st.spinner(f"🎤 Recording for {duration} seconds... Speak naturally!"):
                 fs = 22050
-                audio_data = sd.rec(int(duration * fs), samplerate=fs, channels=1)
+                audio_data = sd.rec(int(duration * fs), samplerate=fs, channels=1, dtype='float32')
                 sd.wait()
                 st.session_state.recorded_audio_path = tempfile.NamedTemporaryFile(
                     delete=False, suffix=".wav"
                 ).name
-                sf.write(st.session_state.recorded_audio_path, audio_data, fs)
+                # Keep samples as 32-bit float on disk so analysis reads them back without conversion
+                sf.write(st.session_state.recorded_audio_path, audio_data, fs, subtype='FLOAT')
                 st.success(f"✅ {duration}-second recording saved!")
                 
                 # Add audio player for recorded file
@@ -201,13 +306,15 @@ if questions:
     if (audio_file is not None or st.session_state.recorded_audio_path) and st.button(
         "🎯 Analyze Speech Quality", type="primary", key="analyze", use_container_width=True
     ):
-        temp_path = None
         try:
             with st.spinner("🎯 Performing comprehensive speech analysis..."):
+                # find_spec only proves the packages are installed; a broken install fails here
+                if load_analyzers() is None:
+                    st.error("Analysis modules not available. Please check installation.")
+                    raise RuntimeError("Analysis unavailable")
+                
                 if audio_file:
-                    temp_path = tempfile.NamedTemporaryFile(delete=False, suffix=".wav").name
-                    with open(temp_path, "wb") as f:
-                        f.write(audio_file.getvalue())
+                    temp_path = cached_upload_path(audio_file)
                 else:
                     temp_path = st.session_state.recorded_audio_path
     
@@ -216,14 +323,18 @@ if questions:
                     raise RuntimeError("Silent recording")
     
                 # Perform comprehensive speech analysis
-                features = analyze_speech(temp_path)
+                features = cached_analyze_speech(temp_path, os.path.getmtime(temp_path))
                 
                 if not features['success']:
                     st.error(f"❌ Analysis failed: {features.get('error', 'Unknown error')}")
                     raise RuntimeError("Analysis failed")
                 
+                if features.get('skipped'):
+                    st.warning("🎤 The clip is too short or too quiet to analyze. Please record at least a few seconds of clear speech.")
+                    raise RuntimeError("Nothing to analyze")
+                
                 # Calculate confidence scores and generate feedback
-                results = analyze_and_score(features)
+                results = cached_analyze_and_score(features)
             
             st.success("✅ Analysis complete!")
             
@@ -239,10 +350,12 @@ if questions:
             with col1:
                 st.metric("🎯 Overall Speech Quality Score", f"{overall_score:.1f}/100")
             with col2:
-                if severity == "Healthy":
+                if severity == "Excellent":
                     st.success(f"✅ **Excellent Quality**")
-                elif severity == "Mild Concern":
+                elif severity == "Good":
                     st.info(f"ℹ️ **Good Quality**")
+                elif severity == "Fair":
+                    st.warning(f"⚠️ **Fair Quality**")
                 else:
                     st.warning(f"⚠️ **Needs Improvement**")
             
@@ -353,16 +466,13 @@ Summary: {feedback['summary']}
             )
             
         except RuntimeError as e:
-            if "Silent recording" not in str(e):
+            if str(e) not in ("Silent recording", "Nothing to analyze", "Analysis unavailable"):
                 st.error(f"❌ Analysis failed: {str(e)}")
         except Exception as e:
             st.error(f"❌ Analysis failed: {str(e)}")
             import traceback
             with st.expander("Show error details"):
                 st.code(traceback.format_exc())
-        finally:
-            if temp_path and os.path.exists(temp_path) and temp_path != st.session_state.recorded_audio_path:
-                os.remove(temp_path)
 else:
     st.error("Could not load interview questions. Please check interview_questions.json file.")
 
@@ -0,0 +1,17 @@
+"""
+Optional Numba compilation shared by the analysis and scoring modules.
+Kernels decorated with ``jit`` run compiled when Numba is installed and as
+plain Python otherwise.
+"""
+
+# Try to import numba (compiled kernels, plain Python otherwise)
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def jit(func):
+    """Compile ``func`` with Numba when it is installed, otherwise return it unchanged."""
+    return numba.njit(cache=True)(func) if NUMBA_AVAILABLE else func
@@ -3,70 +3,528 @@ Advanced speech analysis module for interview response quality assessment.
 Extracts vocal, articulatory, prosodic, and timing features from conversational speech.
 """
 
+import os
+import hashlib
+import pickle
+import time
+import multiprocessing
+from functools import lru_cache
 import numpy as np
+import scipy.fft
+import scipy.signal
+import soundfile as sf
 import librosa
 import parselmouth
 from parselmouth.praat import call
 
+from jit_support import NUMBA_AVAILABLE, jit as _jit
 
-def extract_vocal_features(audio_path, sr=22050):
+try:
+    import pyworld
+    PYWORLD_AVAILABLE = True
+except ImportError:
+    PYWORLD_AVAILABLE = False
+
+try:
+    from threadpoolctl import threadpool_limits
+    THREADPOOLCTL_AVAILABLE = True
+except ImportError:
+    THREADPOOLCTL_AVAILABLE = False
+
+# Pitch search range (Hz). Conversational F0 rarely exceeds ~350 Hz, so
+# capping the search at 400 Hz keeps the trackers' candidate space small.
+SPEECH_FMIN = 75
+SPEECH_FMAX = 400
+
+# Pitch estimation runs on an 8 kHz copy of the signal (F0 sits well below
+# 4 kHz). Onset analysis stays at full rate: consonant energy above 4 kHz
+# drives the onset envelope, and dropping it shifts speech-rate counts.
+LOW_SR = 8000
+PYIN_FRAME_LENGTH = 1024  # ~128 ms at LOW_SR
+F0_HOP_LENGTH = PYIN_FRAME_LENGTH // 4  # fallback F0 frame step (pYIN's default), in samples
+
+
+def load_audio(audio_path, sr=22050):
     """
-    Extract vocal quality features including pitch, jitter, shimmer, and HNR.
+    Load an audio file once for all feature extractors.
     
     Args:
         audio_path: Path to audio file
-        sr: Sample rate
+        sr: Sample rate to resample to
         
     Returns:
-        dict: Vocal features
+        tuple: (contiguous float32 audio time series, sample rate)
     """
-    # Load audio with librosa
-    y, sr = librosa.load(audio_path, sr=sr)
+    # Decode with libsndfile directly (WAV/FLAC/OGG...); librosa.load only for
+    # formats it can't read, e.g. m4a, which librosa hands to audioread
+    try:
+        y, sr_native = _read_mono(audio_path)
+    except RuntimeError as e:
+        if not _is_format_error(e, audio_path):
+            raise
+        y, sr = librosa.load(audio_path, sr=sr, dtype=np.float32)
+        return np.ascontiguousarray(y), sr
     
-    # Load with Parselmouth for advanced voice analysis
+    # Resample the same way librosa.load does
+    if sr is None:
+        sr = sr_native
+    elif sr_native != sr:
+        y = librosa.resample(y, orig_sr=sr_native, target_sr=sr, res_type='soxr_hq')
+    return np.ascontiguousarray(y), sr
+
+
+# libsndfile error codes for files it opened but cannot decode
+_SF_ERR_UNRECOGNISED_FORMAT = 1
+_SF_ERR_UNSUPPORTED_ENCODING = 4
+
+
+def _is_format_error(error, audio_path):
+    """True if libsndfile failed on the file's format rather than on a missing or unreadable file."""
+    if not os.path.isfile(audio_path) or not os.access(audio_path, os.R_OK):
+        return False
+    code = getattr(error, "code", None)  # LibsndfileError, soundfile >= 0.11
+    return code is None or code in (_SF_ERR_UNRECOGNISED_FORMAT, _SF_ERR_UNSUPPORTED_ENCODING)
+
+
+def _read_mono(audio_path, blocksize=1 << 16):
+    """
+    Decode straight into one preallocated float32 mono buffer.
+    
+    Multichannel files are downmixed block by block, so the full
+    multichannel signal is never held in memory.
+    """
+    with sf.SoundFile(audio_path) as f:
+        y = np.empty(f.frames, dtype=np.float32)
+        if f.channels == 1:
+            return f.read(dtype='float32', out=y), f.samplerate
+        
+        block = np.empty((blocksize, f.channels), dtype=np.float32)
+        pos = 0
+        for frames in f.blocks(out=block):
+            n = len(frames)
+            np.mean(frames, axis=1, dtype=np.float32, out=y[pos:pos + n])
+            pos += n
+        return y[:pos], f.samplerate
+
+
+# Opt-in on-disk cache of analyze_speech results for batch and offline runs,
+# keyed by audio content. Bump the version whenever feature extraction
+# changes; dependency versions and optional backends are part of the key too.
+# Entries older than CACHE_MAX_AGE are dropped, then the least recently used
+# ones until the directory fits in CACHE_MAX_BYTES.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "speech_analyzer")
+CACHE_VERSION = 9
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+CACHE_MAX_AGE = 30 * 24 * 3600  # seconds
+
+
+def _cache_environment():
+    """Library versions and optional backends that can change analysis output."""
+    parts = [f"numpy{np.__version__}", f"librosa{librosa.__version__}",
+             f"parselmouth{parselmouth.__version__}",
+             f"numba{NUMBA_AVAILABLE}", f"pyworld{PYWORLD_AVAILABLE}"]
+    if PYWORLD_AVAILABLE:
+        parts.append(getattr(pyworld, "__version__", ""))
+    return ":".join(parts)
+
+
+_CACHE_ENVIRONMENT = _cache_environment()
+
+
+def _cache_key(audio_path, sr, backend='numpy', chunk_size=1 << 16):
+    """Content hash of the audio file, combined with the analysis settings."""
+    # Backends differ by float32 rounding, so each keeps its own entries; a
+    # 'torch' request that falls back to numpy shares the numpy ones
+    if backend == 'torch' and _cuda_torch() is None:
+        backend = 'numpy'
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{CACHE_VERSION}:sr{sr}:{backend}:{_CACHE_ENVIRONMENT}:".encode())
+    with open(audio_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_dir_is_private():
+    """True if CACHE_DIR is ours and nobody else can write to it, so its pickles can be trusted."""
+    st = os.stat(CACHE_DIR)
+    getuid = getattr(os, "getuid", None)  # POSIX only
+    return getuid is None or (st.st_uid == getuid() and not st.st_mode & 0o022)
+
+
+def _read_cache(key):
+    """Return a cached analysis result, or None on a miss or unreadable entry."""
     try:
-        sound = parselmouth.Sound(audio_path)
+        if not _cache_dir_is_private():
+            return None
+        path = os.path.join(CACHE_DIR, key + ".pkl")
+        with open(path, "rb") as f:
+            result = pickle.load(f)
+        os.utime(path)  # mark as recently used for eviction
+        return result
+    except Exception:
+        return None
+
+
+def _write_cache(key, result):
+    """Store an analysis result; caching is best-effort and never raises."""
+    try:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        if not _cache_dir_is_private():
+            return
+        path = os.path.join(CACHE_DIR, key + ".pkl")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)  # atomic, so concurrent workers never see partial files
+        _evict_cache()
+    except Exception:
+        pass
+
+
+def _evict_cache():
+    """Drop expired entries, then the least recently used until CACHE_DIR fits in CACHE_MAX_BYTES."""
+    entries = []
+    for entry in os.scandir(CACHE_DIR):
+        if entry.name.endswith(".pkl"):
+            st = entry.stat()
+            entries.append((st.st_mtime, st.st_size, entry.path))
+    entries.sort(reverse=True)  # most recently used first
+    
+    cutoff = time.time() - CACHE_MAX_AGE
+    total = 0
+    for mtime, size, path in entries:
+        if mtime >= cutoff and total + size <= CACHE_MAX_BYTES:
+            total += size
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # already removed by another worker
+
+
+def downsample(y, sr, target_sr=LOW_SR):
+    """
+    Resample a signal down to target_sr for pitch analysis.
+    
+    Args:
+        y: Audio time series
+        sr: Sample rate of y
+        target_sr: Sample rate to resample to (signals at or below it are kept)
+        
+    Returns:
+        tuple: (resampled time series, sample rate)
+    """
+    if sr <= target_sr:
+        return y, sr
+    return librosa.resample(y, orig_sr=sr, target_sr=target_sr), target_sr
+
+
+def onset_envelope(y, sr):
+    """
+    Onset strength envelope shared by the rhythm and speech-rate features.
+    
+    Args:
+        y: Full-rate audio time series
+        sr: Sample rate of y
+        
+    Returns:
+        np.ndarray: Onset strength per 512-sample hop (librosa's default)
+    """
+    return librosa.onset.onset_strength(y=y, sr=sr)
+
+
+def magnitude_spectrogram(y, n_fft=2048, hop_length=512, backend='numpy'):
+    """
+    Magnitude STFT shared by the spectral and MFCC features.
+    
+    Args:
+        y: Audio time series
+        n_fft: FFT window size (librosa's default)
+        hop_length: Hop between frames (librosa's default)
+        backend: 'numpy', or 'torch' to run the STFT on a CUDA device when one is available
+        
+    Returns:
+        np.ndarray: |STFT| with shape (1 + n_fft // 2, frames)
+    """
+    if backend not in ('numpy', 'torch'):
+        raise ValueError(f"Unknown backend: {backend!r}")
+    
+    torch = _cuda_torch() if backend == 'torch' else None
+    if torch is not None:
+        signal = torch.from_numpy(np.ascontiguousarray(y)).to('cuda')
+        window = torch.hann_window(n_fft, periodic=True, dtype=signal.dtype, device='cuda')
+        spectrum = torch.stft(signal, n_fft, hop_length=hop_length, window=window,
+                              center=True, pad_mode='constant', return_complex=True)
+        return spectrum.abs().cpu().numpy()
+    
+    window = _hann_window(n_fft).astype(y.dtype, copy=False)
+    frames = _frames(y, n_fft, hop_length) * window
+    return np.abs(scipy.fft.rfft(frames, axis=-1)).T
+
+
+@lru_cache(maxsize=1)
+def _cuda_torch():
+    """Return the torch module if a CUDA device is usable, else None (torch is imported lazily)."""
+    try:
+        import torch
+    except ImportError:
+        print("PyTorch is not installed, using the numpy backend")
+        return None
+    if not torch.cuda.is_available():
+        print("No CUDA device available, using the numpy backend")
+        return None
+    return torch
+
+
+@lru_cache(maxsize=8)
+def _hann_window(n_fft):
+    """Periodic Hann window, as used by librosa.stft."""
+    window = scipy.signal.get_window('hann', n_fft, fftbins=True)
+    window.flags.writeable = False
+    return window
+
+
+@lru_cache(maxsize=8)
+def _mel_filterbank(sr, n_fft=2048, n_mels=128):
+    """Mel filterbank for one (sr, n_fft), built once instead of per call."""
+    mel_fb = librosa.filters.mel(sr=sr, n_fft=n_fft, n_mels=n_mels)
+    mel_fb.flags.writeable = False
+    return mel_fb
+
+
+@lru_cache(maxsize=8)
+def _dct_matrix(n_mels=128, n_mfcc=13):
+    """First n_mfcc rows of the orthonormal DCT-II, so MFCCs are one matrix product."""
+    dct = scipy.fft.dct(np.eye(n_mels, dtype=np.float32), type=2, axis=0, norm='ortho')[:n_mfcc]
+    dct = np.ascontiguousarray(dct)
+    dct.flags.writeable = False
+    return dct
+
+
+# Build the filterbank and DCT for the default settings at import, off the per-clip path
+_mel_filterbank(22050, 2048)
+_dct_matrix(128, 13)
+
+
+def mfcc_from_spectrogram(S, sr, n_mfcc=13, top_db=80.0):
+    """
+    MFCCs from a magnitude spectrogram, equivalent to librosa.feature.mfcc.
+    
+    Args:
+        S: Magnitude spectrogram from magnitude_spectrogram
+        sr: Sample rate of the analysed signal
+        n_mfcc: Number of coefficients to keep
+        top_db: Dynamic range of the log-mel spectrogram (power_to_db's default)
+        
+    Returns:
+        np.ndarray: MFCCs with shape (n_mfcc, frames)
+    """
+    mel_fb = _mel_filterbank(sr, 2 * (S.shape[0] - 1))
+    mel = mel_fb @ (S * S)
+    log_mel = 10.0 * np.log10(np.maximum(mel, 1e-10))
+    log_mel = np.maximum(log_mel, log_mel.max() - top_db)
+    return _dct_matrix(mel_fb.shape[0], n_mfcc) @ log_mel
+
+
+def zero_crossing_rate(y, frame_length=2048, hop_length=512, threshold=1e-10):
+    """
+    Zero-crossing rate per frame, equivalent to librosa.feature.zero_crossing_rate.
+    
+    Args:
+        y: Audio time series
+        frame_length: Samples per frame
+        hop_length: Samples between frame starts
+        threshold: Magnitudes at or below this count as zero (non-negative)
+        
+    Returns:
+        np.ndarray: Fraction of sample pairs in each frame whose sign changes
+    """
+    y = np.pad(y, frame_length // 2, mode='edge')
+    negative = y < -threshold
+    
+    # Running count of sign changes, so each frame is a difference of two sums
+    changes = np.zeros(len(y), dtype=np.int64)
+    np.cumsum(negative[1:] != negative[:-1], out=changes[1:])
+    
+    starts = np.arange(1 + (len(y) - frame_length) // hop_length) * hop_length
+    return (changes[starts + frame_length - 1] - changes[starts]) / frame_length
+
+
+def frame_energy(y, frame_length=2048, hop_length=512):
+    """
+    Sum of squares per frame, framed like librosa.feature.rms (center=True).
+    
+    Args:
+        y: Audio time series
+        frame_length: Samples per frame
+        hop_length: Samples between frame starts
+        
+    Returns:
+        np.ndarray: Frame energies; rms**2 * frame_length in librosa's terms
+    """
+    frames = _frames(y, frame_length, hop_length)
+    return np.einsum('ij,ij->i', frames, frames)
+
+
+def _frames(y, frame_length, hop_length):
+    """Strided (frames, frame_length) view of y, zero-padded like librosa's center=True."""
+    y = np.pad(y, frame_length // 2)
+    return np.lib.stride_tricks.sliding_window_view(y, frame_length)[::hop_length]
+
+
+def _as_signal(y, sr):
+    """Accept a preloaded signal, or load one from a path (legacy call style)."""
+    if isinstance(y, (str, os.PathLike)):
+        return load_audio(y, sr)
+    # Features are computed in float32 throughout; float64 only doubles the bytes moved
+    return np.ascontiguousarray(y, dtype=np.float32), sr
+
+
+def praat_pitch(sound):
+    """
+    Praat pitch analysis (autocorrelation) over the speech F0 range.
+    
+    Args:
+        sound: parselmouth.Sound to analyse
+        
+    Returns:
+        parselmouth.Pitch: Pitch object, reusable for the jitter/shimmer point process
+    """
+    return call(sound, "To Pitch", 0.0, SPEECH_FMIN, SPEECH_FMAX)
+
+
+def estimate_f0(y, sr=22050, sound=None, y_lo=None, pitch=None):
+    """
+    Estimate the voiced F0 contour shared by the vocal and prosodic features.
+    
+    The search is limited to SPEECH_FMIN..SPEECH_FMAX, the range of adult
+    conversational speech; higher voices (singing, children) may be missed.
+    
+    Args:
+        y: Audio time series
+        sr: Sample rate of y
+        sound: Optional parselmouth.Sound of the same audio
+        y_lo: Optional (time series, sample rate) from downsample
+        pitch: Optional parselmouth.Pitch from praat_pitch
+        
+    Returns:
+        np.ndarray: F0 values (Hz) of the voiced frames
+    """
+    # Praat's pitch tracker first, WORLD or pYIN only if Praat is unavailable
+    try:
+        if pitch is None:
+            if sound is None:
+                sound = parselmouth.Sound(values=y, sampling_frequency=sr)
+            pitch = praat_pitch(sound)
         
-        # Extract pitch
-        pitch = call(sound, "To Pitch", 0.0, 75, 600)
         f0_values = pitch.selected_array['frequency']
-        f0_values = f0_values[f0_values != 0]  # Remove unvoiced frames
+        return f0_values[f0_values != 0]  # Remove unvoiced frames
+        
+    except Exception as e:
+        print(f"Parselmouth pitch analysis failed: {e}, using fallback pitch tracker")
+        y_lo, sr_lo = y_lo if y_lo is not None else downsample(y, sr)
+        return _fallback_f0(y_lo, sr_lo)
+
+
+def _fallback_f0(y, sr):
+    """Voiced F0 without Praat: pyworld DIO + StoneMask when installed (much faster), else librosa pYIN."""
+    if PYWORLD_AVAILABLE:
+        x = np.ascontiguousarray(y, dtype=np.float64)
+        frame_period = 1000 * F0_HOP_LENGTH / sr  # ms; same frame step as the pYIN path
+        f0, t = pyworld.dio(x, sr, f0_floor=SPEECH_FMIN, f0_ceil=SPEECH_FMAX, frame_period=frame_period)
+        f0 = pyworld.stonemask(x, f0, t, sr)
+        return f0[f0 > 0]  # Remove unvoiced frames
+    
+    f0, voiced_flag, voiced_probs = librosa.pyin(y, fmin=SPEECH_FMIN, fmax=SPEECH_FMAX, sr=sr,
+                                                 frame_length=PYIN_FRAME_LENGTH, hop_length=F0_HOP_LENGTH)
+    return f0[~np.isnan(f0)]
+
+
+@_jit
+def _f0_stats(f0_values):
+    """Mean, standard deviation, min and max of an F0 contour in one pass (zeros if empty)."""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    f0_min = np.inf
+    f0_max = -np.inf
+    for f0 in f0_values:
+        # Welford's online update of mean and sum of squared deviations
+        n += 1
+        delta = f0 - mean
+        mean += delta / n
+        m2 += delta * (f0 - mean)
+        f0_min = min(f0_min, f0)
+        f0_max = max(f0_max, f0)
+    
+    if n == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    return mean, np.sqrt(m2 / n), f0_min, f0_max
+
+
+def _f0_summary(f0_values):
+    """Mean, standard deviation, min and max of an F0 contour (zeros if empty)."""
+    f0_values = np.asarray(f0_values, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _f0_stats(f0_values)
+    # Interpreted, the one-pass loop is far slower than numpy's reductions
+    if f0_values.size == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    return np.mean(f0_values), np.std(f0_values), np.min(f0_values), np.max(f0_values)
+
+
+def extract_vocal_features(y, sr=22050, sound=None, f0_values=None, pitch=None):
+    """
+    Extract vocal quality features including pitch, jitter, shimmer, and HNR.
+    
+    Args:
+        y: Audio time series (a path to an audio file is also accepted)
+        sr: Sample rate of y
+        sound: Optional parselmouth.Sound of the same audio
+        f0_values: Optional voiced F0 contour from estimate_f0
+        pitch: Optional parselmouth.Pitch of the same audio, from praat_pitch
         
-        # Pitch statistics
-        f0_mean = np.mean(f0_values) if len(f0_values) > 0 else 0
-        f0_std = np.std(f0_values) if len(f0_values) > 0 else 0
-        f0_min = np.min(f0_values) if len(f0_values) > 0 else 0
-        f0_max = np.max(f0_values) if len(f0_values) > 0 else 0
-        f0_range = f0_max - f0_min
+    Returns:
+        dict: Vocal features
+    """
+    y, sr = _as_signal(y, sr)
+    
+    if f0_values is None:
+        f0_values = estimate_f0(y, sr, sound)
+    
+    # Pitch statistics
+    f0_mean, f0_std, f0_min, f0_max = _f0_summary(f0_values)
+    f0_range = f0_max - f0_min
+    
+    # Parselmouth for advanced voice analysis, built from the loaded samples
+    try:
+        if sound is None:
+            sound = parselmouth.Sound(values=y, sampling_frequency=sr)
         
-        # Jitter (pitch perturbation)
-        point_process = call(sound, "To PointProcess (periodic, cc)", 75, 600)
+        # Jitter (pitch perturbation); glottal pulses from the existing pitch track
+        # if there is one (same result as "periodic, cc" without re-running pitch)
+        if pitch is not None:
+            point_process = call([sound, pitch], "To PointProcess (cc)")
+        else:
+            point_process = call(sound, "To PointProcess (periodic, cc)", SPEECH_FMIN, SPEECH_FMAX)
         jitter = call(point_process, "Get jitter (local)", 0, 0, 0.0001, 0.02, 1.3)
         
         # Shimmer (amplitude perturbation)
         shimmer = call([sound, point_process], "Get shimmer (local)", 0, 0, 0.0001, 0.02, 1.3, 1.6)
         
         # Harmonics-to-Noise Ratio
-        harmonicity = call(sound, "To Harmonicity (cc)", 0.01, 75, 0.1, 1.0)
+        harmonicity = call(sound, "To Harmonicity (cc)", 0.01, SPEECH_FMIN, 0.1, 1.0)
         hnr = call(harmonicity, "Get mean", 0, 0)
         
     except Exception as e:
-        print(f"Parselmouth analysis failed: {e}, using librosa fallback")
-        # Fallback to librosa-only analysis
-        f0, voiced_flag, voiced_probs = librosa.pyin(y, fmin=75, fmax=600, sr=sr)
-        f0_values = f0[~np.isnan(f0)]
-        
-        f0_mean = np.mean(f0_values) if len(f0_values) > 0 else 0
-        f0_std = np.std(f0_values) if len(f0_values) > 0 else 0
-        f0_min = np.min(f0_values) if len(f0_values) > 0 else 0
-        f0_max = np.max(f0_values) if len(f0_values) > 0 else 0
-        f0_range = f0_max - f0_min
+        print(f"Parselmouth analysis failed: {e}, voice quality measures unavailable")
         jitter = 0
         shimmer = 0
         hnr = 0
     
     # RMS energy (loudness)
-    rms = librosa.feature.rms(y=y)[0]
+    rms = np.sqrt(frame_energy(y) / 2048)
     rms_mean = np.mean(rms)
     rms_std = np.std(rms)
     
@@ -84,31 +542,34 @@ def extract_vocal_features(audio_path, sr=22050):
     }
 
 
-def extract_articulatory_features(audio_path, sr=22050):
+def extract_articulatory_features(y, sr=22050, S=None):
     """
     Extract articulation features including formants, vowel space, and clarity measures.
     
     Args:
-        audio_path: Path to audio file
-        sr: Sample rate
+        y: Audio time series (a path to an audio file is also accepted)
+        sr: Sample rate of y
+        S: Optional magnitude spectrogram from magnitude_spectrogram
         
     Returns:
         dict: Articulatory features
     """
-    y, sr = librosa.load(audio_path, sr=sr)
+    y, sr = _as_signal(y, sr)
+    if S is None:
+        S = magnitude_spectrogram(y)
     
     # Formant analysis (approximation using spectral features)
-    spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
-    spectral_bandwidth = librosa.feature.spectral_bandwidth(y=y, sr=sr)[0]
-    spectral_rolloff = librosa.feature.spectral_rolloff(y=y, sr=sr)[0]
+    spectral_centroid = librosa.feature.spectral_centroid(S=S, sr=sr)[0]
+    spectral_bandwidth = librosa.feature.spectral_bandwidth(S=S, sr=sr)[0]
+    spectral_rolloff = librosa.feature.spectral_rolloff(S=S, sr=sr)[0]
     
     # Zero crossing rate (articulation clarity indicator)
-    zcr = librosa.feature.zero_crossing_rate(y)[0]
+    zcr = zero_crossing_rate(y)
     zcr_mean = np.mean(zcr)
     zcr_std = np.std(zcr)
     
     # Spectral contrast (articulation precision)
-    spectral_contrast = librosa.feature.spectral_contrast(y=y, sr=sr)
+    spectral_contrast = librosa.feature.spectral_contrast(S=S, sr=sr)
     spectral_contrast_mean = np.mean(spectral_contrast)
     
     return {
@@ -122,36 +583,51 @@ def extract_articulatory_features(audio_path, sr=22050):
     }
 
 
-def extract_prosodic_features(audio_path, sr=22050):
+def extract_prosodic_features(y, sr=22050, f0_values=None, y_lo=None, S=None, onset_env=None):
     """
     Extract prosodic features including intonation, rhythm, and stress patterns.
     
     Args:
-        audio_path: Path to audio file
-        sr: Sample rate
+        y: Audio time series (a path to an audio file is also accepted)
+        sr: Sample rate of y
+        f0_values: Optional voiced F0 contour from estimate_f0
+        y_lo: Optional (time series, sample rate) from downsample
+        S: Optional magnitude spectrogram from magnitude_spectrogram
+        onset_env: Optional onset strength envelope from onset_envelope
         
     Returns:
         dict: Prosodic features
     """
-    y, sr = librosa.load(audio_path, sr=sr)
+    y, sr = _as_signal(y, sr)
+    y_lo, sr_lo = y_lo if y_lo is not None else downsample(y, sr)
     
-    # Pitch variation (already computed in vocal features, but important for prosody)
-    f0, voiced_flag, voiced_probs = librosa.pyin(y, fmin=75, fmax=600, sr=sr)
-    f0_values = f0[~np.isnan(f0)]
+    # Pitch variation, from the same F0 contour as the vocal features
+    if f0_values is None:
+        f0_values = estimate_f0(y, sr, y_lo=(y_lo, sr_lo))
     
     # Pitch variation coefficient
-    pitch_variation = np.std(f0_values) / np.mean(f0_values) if len(f0_values) > 0 and np.mean(f0_values) > 0 else 0
+    f0_mean, f0_std, _, _ = _f0_summary(f0_values)
+    pitch_variation = f0_std / f0_mean if f0_mean > 0 else 0
     
     # Energy variation (stress patterns)
-    rms = librosa.feature.rms(y=y)[0]
+    rms = np.sqrt(frame_energy(y) / 2048)
     energy_variation = np.std(rms) / np.mean(rms) if np.mean(rms) > 0 else 0
     
     # Rhythm features using onset detection
-    onset_env = librosa.onset.onset_strength(y=y, sr=sr)
-    tempo, beats = librosa.beat.beat_track(onset_envelope=onset_env, sr=sr)
+    if onset_env is None:
+        onset_env = onset_envelope(y, sr)
+    # Tempo only (autocorrelation); beat positions were never used, so skip beat tracking.
+    # With no onsets at all, tempo() falls back to its prior (~117 BPM) where
+    # beat_track reports 0, so keep the 0
+    if onset_env.any():
+        tempo = librosa.feature.tempo(onset_envelope=onset_env, sr=sr)
+    else:
+        tempo = np.zeros(1)
     
-    # Mel-frequency cepstral coefficients (speech quality)
-    mfcc = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
+    # Mel-frequency cepstral coefficients (speech quality), from the shared STFT
+    if S is None:
+        S = magnitude_spectrogram(y)
+    mfcc = mfcc_from_spectrogram(S, sr, n_mfcc=13)
     mfcc_mean = np.mean(mfcc, axis=1)
     mfcc_std = np.std(mfcc, axis=1)
     
@@ -159,49 +635,97 @@ def extract_prosodic_features(audio_path, sr=22050):
         'pitch_variation': pitch_variation,
         'energy_variation': energy_variation,
         'tempo': tempo,
-        'mfcc_mean': mfcc_mean.tolist(),
-        'mfcc_std': mfcc_std.tolist()
+        'mfcc_mean': mfcc_mean.astype(np.float32, copy=False),
+        'mfcc_std': mfcc_std.astype(np.float32, copy=False)
     }
 
 
-def extract_timing_features(audio_path, sr=22050, silence_threshold=0.01):
+@_jit
+def _vad_stats(y, frame_length, hop_length, energy_threshold):
+    """
+    Voiced-frame and pause counts in a single pass over y.
+    
+    Frames are centred like frame_energy (zero padding at the edges) and
+    frame_length must be a multiple of hop_length: each sample is squared once
+    into a hop-sized block, and frame energies are sums of adjacent blocks.
+    A frame is speech when its energy exceeds energy_threshold; a pause is
+    counted on every speech-to-silence transition.
+    """
+    n_frames = 1 + len(y) // hop_length
+    hops_per_frame = frame_length // hop_length
+    half = frame_length // 2
+    
+    # Energy of each hop-sized block of the zero-padded signal
+    blocks = np.zeros(n_frames + hops_per_frame - 1)
+    for b in range(len(blocks)):
+        start = max(b * hop_length - half, 0)
+        stop = min((b + 1) * hop_length - half, len(y))
+        energy = 0.0
+        for j in range(start, stop):
+            energy += y[j] * y[j]
+        blocks[b] = energy
+    
+    voiced = 0
+    falls = 0
+    prev = False
+    for i in range(n_frames):
+        energy = 0.0
+        for k in range(hops_per_frame):
+            energy += blocks[i + k]
+        
+        speech = energy > energy_threshold
+        if speech:
+            voiced += 1
+        if prev and not speech:
+            falls += 1
+        prev = speech
+    return voiced, falls
+
+
+def extract_timing_features(y, sr=22050, silence_threshold=0.01, onset_env=None):
     """
     Extract timing features including pauses, speech rate, and articulation rate.
     
     Args:
-        audio_path: Path to audio file
-        sr: Sample rate
+        y: Audio time series (a path to an audio file is also accepted)
+        sr: Sample rate of y
         silence_threshold: Threshold for silence detection
+        onset_env: Optional onset strength envelope from onset_envelope
         
     Returns:
         dict: Timing features
     """
-    y, sr = librosa.load(audio_path, sr=sr)
+    y, sr = _as_signal(y, sr)
     
     # Total duration
     total_duration = len(y) / sr
     
     # Detect speech/silence using energy
-    rms = librosa.feature.rms(y=y, frame_length=2048, hop_length=512)[0]
-    rms_threshold = silence_threshold
-    
-    # Speech frames
-    speech_frames = rms > rms_threshold
+    # (rms > threshold, compared in the squared domain to skip the sqrt)
+    energy_threshold = silence_threshold ** 2 * 2048
+    if NUMBA_AVAILABLE:
+        # One compiled sweep: frame energy, voiced count and speech-to-silence transitions
+        voiced_frames, num_pauses = _vad_stats(y, 2048, 512, energy_threshold)
+    else:
+        # Speech frames, as a 0/1 byte mask
+        energy = frame_energy(y, frame_length=2048, hop_length=512)
+        speech_frames = (energy > energy_threshold).view(np.uint8)
+        voiced_frames = int(np.count_nonzero(speech_frames))
+        # Transitions from speech to silence (falling edges of the mask)
+        num_pauses = int(np.count_nonzero(speech_frames[:-1] > speech_frames[1:]))
     
     # Calculate speech and pause durations
     frame_duration = 512 / sr  # hop_length / sr
-    speech_duration = np.sum(speech_frames) * frame_duration
+    speech_duration = voiced_frames * frame_duration
     pause_duration = total_duration - speech_duration
     
     # Pause frequency (number of pauses per second)
-    # Detect transitions from speech to silence
-    transitions = np.diff(speech_frames.astype(int))
-    num_pauses = np.sum(transitions == -1)
     pause_frequency = num_pauses / total_duration if total_duration > 0 else 0
     
     # Speech rate (approximate syllables per second)
     # Using onset detection as proxy for syllables
-    onset_env = librosa.onset.onset_strength(y=y, sr=sr)
+    if onset_env is None:
+        onset_env = onset_envelope(y, sr)
     onsets = librosa.onset.onset_detect(onset_envelope=onset_env, sr=sr)
     num_syllables = len(onsets)
     speech_rate = num_syllables / speech_duration if speech_duration > 0 else 0
@@ -224,32 +748,155 @@ def extract_timing_features(audio_path, sr=22050, silence_threshold=0.01):
     }
 
 
-def analyze_speech(audio_path, sr=22050):
+def _warm_up_kernels():
+    """Compile (or load from cache) the F0 and VAD kernels for the dtypes used at runtime."""
+    _f0_stats(np.zeros(1))
+    _vad_stats(np.zeros(2048, dtype=np.float32), 2048, 512, 0.0)
+
+
+if NUMBA_AVAILABLE:
+    _warm_up_kernels()
+
+
+# Clips shorter than this (seconds) or quieter than this RMS are not analysed
+MIN_DURATION = 0.3
+SILENCE_RMS = 1e-4
+
+
+def _skipped_result(total_duration, n_mfcc=13):
+    """Zeroed analysis result for clips with no analysable speech."""
+    zeros = np.zeros(n_mfcc, dtype=np.float32)
+    return {
+        'vocal': dict.fromkeys(('f0_mean', 'f0_std', 'f0_min', 'f0_max', 'f0_range',
+                                'jitter', 'shimmer', 'hnr', 'rms_mean', 'rms_std'), 0.0),
+        'articulatory': dict.fromkeys(('spectral_centroid_mean', 'spectral_centroid_std',
+                                       'spectral_bandwidth_mean', 'spectral_rolloff_mean',
+                                       'zcr_mean', 'zcr_std', 'spectral_contrast_mean'), 0.0),
+        'prosodic': {
+            'pitch_variation': 0.0,
+            'energy_variation': 0.0,
+            'tempo': np.zeros(1),  # librosa.feature.tempo returns a 1-element array
+            'mfcc_mean': zeros,
+            'mfcc_std': zeros.copy()
+        },
+        'timing': {
+            'total_duration': total_duration,
+            'speech_duration': 0.0,
+            'pause_duration': total_duration,
+            'pause_frequency': 0.0,
+            'num_pauses': 0,
+            'speech_rate': 0.0,
+            'articulation_rate': 0.0,
+            'pause_to_speech_ratio': 0.0
+        },
+        'success': True,
+        'skipped': 'silent_or_short'
+    }
+
+
+def analyze_speech(audio_path, sr=22050, cache=False, backend='numpy'):
     """
     Comprehensive speech analysis combining all feature types.
     
     Args:
         audio_path: Path to audio file
         sr: Sample rate
+        cache: Reuse and store results in CACHE_DIR, keyed by file content (off by
+            default; meant for batch and offline runs over the same files)
+        backend: 'numpy', or 'torch' to compute the shared STFT on a CUDA GPU
         
     Returns:
-        dict: All extracted features organized by category
+        dict: All extracted features organized by category. Silent clips and
+        clips shorter than MIN_DURATION get zeroed features and a 'skipped' key.
     """
     try:
-        vocal_features = extract_vocal_features(audio_path, sr)
-        articulatory_features = extract_articulatory_features(audio_path, sr)
-        prosodic_features = extract_prosodic_features(audio_path, sr)
-        timing_features = extract_timing_features(audio_path, sr)
+        key = _cache_key(audio_path, sr, backend) if cache else None
+        if key is not None:
+            cached = _read_cache(key)
+            if cached is not None:
+                return cached
         
-        return {
+        # Decode and resample once; every extractor works on the same samples
+        y, sr = load_audio(audio_path, sr)
+        
+        # Skip the whole pipeline for empty, near-silent or very short clips
+        total_duration = len(y) / sr
+        if total_duration < MIN_DURATION or np.sqrt(np.dot(y, y) / len(y)) < SILENCE_RMS:
+            return _skipped_result(total_duration)
+        
+        # One Praat Sound and pitch track, shared by vocal and prosodic stages
+        try:
+            sound = parselmouth.Sound(values=y, sampling_frequency=sr)
+            pitch = praat_pitch(sound)
+        except Exception:
+            sound = pitch = None
+        
+        # 8 kHz copy for pitch analysis; spectral and onset features keep full rate
+        y_lo = downsample(y, sr)
+        f0_values = estimate_f0(y, sr, sound, y_lo=y_lo, pitch=pitch)
+        
+        # One STFT for all spectral and MFCC features, one onset envelope for rhythm
+        S = magnitude_spectrogram(y, backend=backend)
+        onset_env = onset_envelope(y, sr)
+        
+        vocal_features = extract_vocal_features(y, sr, sound=sound, f0_values=f0_values, pitch=pitch)
+        articulatory_features = extract_articulatory_features(y, sr, S=S)
+        prosodic_features = extract_prosodic_features(y, sr, f0_values=f0_values, y_lo=y_lo, S=S, onset_env=onset_env)
+        timing_features = extract_timing_features(y, sr, onset_env=onset_env)
+        
+        result = {
             'vocal': vocal_features,
             'articulatory': articulatory_features,
             'prosodic': prosodic_features,
             'timing': timing_features,
             'success': True
         }
+        if key is not None:
+            _write_cache(key, result)
+        return result
     except Exception as e:
         return {
             'success': False,
             'error': str(e)
         }
+
+
+def _init_batch_worker():
+    """Keep BLAS/OpenMP single-threaded in each worker so processes don't oversubscribe cores."""
+    if THREADPOOLCTL_AVAILABLE:
+        threadpool_limits(limits=1)
+
+
+def _analyze_indexed(job):
+    """Pool task: analyze one (index, path, sr, cache, backend) job and keep its index."""
+    index, audio_path, sr, cache, backend = job
+    return index, analyze_speech(audio_path, sr, cache, backend)
+
+
+def analyze_speech_batch(paths, sr=22050, n_workers=None, cache=False, backend='numpy'):
+    """
+    Analyze many audio files in parallel, one process per CPU core.
+    
+    Args:
+        paths: Iterable of audio file paths
+        sr: Sample rate
+        n_workers: Number of worker processes (defaults to the CPU count)
+        cache: Passed through to analyze_speech
+        backend: Passed through to analyze_speech
+        
+    Returns:
+        list: analyze_speech results, in the same order as paths
+    """
+    paths = list(paths)
+    if not paths:
+        return []
+    
+    n_workers = min(n_workers or os.cpu_count() or 1, len(paths))
+    jobs = [(i, path, sr, cache, backend) for i, path in enumerate(paths)]
+    results = [None] * len(paths)
+    
+    with multiprocessing.Pool(n_workers, initializer=_init_batch_worker) as pool:
+        for index, result in pool.imap_unordered(_analyze_indexed, jobs, chunksize=4):
+            results[index] = result
+    
+    return results